@@ -13,11 +13,15 @@ Sections:
     - TF-IDF Vectorization: Feature extraction params
     - LDA Topic Modeling: Topic model hyperparameters
     - BERT Classification: Pre-trained model identifiers
+    - HuggingFace Hub: Download cache settings
     - Sentiment Analysis: Batch sizes, checkpoints
     - Party Mappings: factionId → party name
     - Topic Labels: topic ID → German label
 """
 
+import importlib.util
+import os
+from pathlib import Path
 from typing import Dict, Any, List
 
 # ============================================================================
@@ -30,6 +34,9 @@ MIN_SPEECH_LENGTH: int = 200
 #: Maximum words per text segment (for optimal sentiment model performance)
 MAX_WORDS_PER_PARAGRAPH: int = 300
 
+#: Maximum characters per text segment for sentiment input (~512 BERT tokens)
+MAX_CHARS_PER_PARAGRAPH: int = 2000
+
 # ============================================================================
 # TF-IDF VECTORIZATION
 # ============================================================================
@@ -55,6 +62,15 @@ LDA_PARAMS: Dict[str, Any] = {
     'n_jobs': -1               # Use all CPU cores
 }
 
+#: gensim LdaMulticore settings (src.models.lda.fit_lda)
+LDA_MULTICORE_PARAMS: Dict[str, Any] = {
+    'chunksize': 2000,         # Documents per worker update
+    'passes': 10,              # Passes over the corpus
+}
+
+#: Chunk sizes swept by src.models.lda.tune_chunksize
+LDA_CHUNKSIZE_CANDIDATES: List[int] = [500, 1000, 2000, 4000, 8000]
+
 COUNT_VECTORIZER_PARAMS: Dict[str, Any] = {
     'max_features': 1000,
     'min_df': 10,
@@ -69,14 +85,35 @@ COUNT_VECTORIZER_PARAMS: Dict[str, Any] = {
 #: HuggingFace model for German parliamentary topic classification
 BERT_TOPIC_MODEL: str = "chkla/parlbert-topic-german"
 
+#: HuggingFace model behind germansentiment.SentimentModel()
+SENTIMENT_MODEL: str = "oliverguhr/german-sentiment-bert"
+
+# ============================================================================
+# HUGGINGFACE HUB
+# ============================================================================
+
+# Set before transformers/huggingface_hub are imported so every download
+# goes to the shared cache. hf_transfer (parallel Rust downloader) is only
+# enabled when installed, since huggingface_hub errors out otherwise.
+os.environ.setdefault('HF_HOME', str(Path.home() / '.cache' / 'huggingface'))
+if importlib.util.find_spec('hf_transfer') is not None:
+    os.environ.setdefault('HF_HUB_ENABLE_HF_TRANSFER', '1')
+
 # ============================================================================
 # SENTIMENT ANALYSIS
 # ============================================================================
 
-#: Batch sizes (GPU: 256, CPU: 128)
+#: Upper bounds for the batch size probe (GPU: 256, CPU: 128)
 SENTIMENT_BATCH_SIZE_GPU: int = 256
 SENTIMENT_BATCH_SIZE_CPU: int = 128
 
+#: Batch size probe: GPU doubles from the start size, CPU sweeps candidates
+SENTIMENT_BATCH_SIZE_START: int = 8
+SENTIMENT_BATCH_SIZE_CANDIDATES_CPU: List[int] = [8, 16, 32, 64]
+
+#: Stop doubling once peak GPU memory exceeds this fraction of total memory
+SENTIMENT_GPU_MEMORY_LIMIT_FRAC: float = 0.9
+
 #: Save checkpoint every N batches
 CHECKPOINT_INTERVAL: int = 50
 
@@ -90,6 +127,15 @@ DATA_PATHS: Dict[str, str] = {
     'processed': 'data/processed'
 }
 
+#: Columns of the speeches dataset used by the pipeline. This is currently the
+#: full speeches schema, so load_speeches(columns=REQUIRED_COLUMNS) saves no
+#: I/O; it only pins the column order and fails fast if a column is missing.
+REQUIRED_COLUMNS: List[str] = [
+    'id', 'session', 'electoralTerm', 'firstName', 'lastName', 'politicianId',
+    'speechContent', 'factionId', 'documentUrl', 'positionShort', 'positionLong',
+    'date'
+]
+
 # ============================================================================
 # REPRODUCIBILITY
 # ============================================================================
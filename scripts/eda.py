@@ -1,12 +1,15 @@
+import sys
+
 import polars as pl
 from pathlib import Path
 import matplotlib.pyplot as plt
 
-# Load the sample data from raw folder
-data_dir = Path('data')
-sample_path = data_dir / 'raw' / 'df_sample.csv'
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.data.load_data import load_sample
 
-df = pl.read_csv(sample_path)
+# Load the sample data from raw folder (df_sample.parquet, falling back to CSV)
+df = load_sample(eager=True)
 
 print("=" * 80)
 print("EXPLORATORY DATA ANALYSIS")
@@ -33,24 +36,27 @@ print(df.head())
 
 # 5. Column information
 print("\n5. COLUMN INFORMATION")
+# All unique counts in a single pass over the frame
+uniques = df.select([pl.col(c).n_unique().alias(c) for c in df.columns]).row(0, named=True)
 for col in df.columns:
     col_type = df.schema[col]
-    unique_count = df.select(col).n_unique()
-    print(f"  {col}: {col_type}, Unique values: {unique_count}")
+    print(f"  {col}: {col_type}, Unique values: {uniques[col]}")
 
 # 6. Text length analysis (if text column exists)
 text_columns = [col for col in df.columns if df.schema[col] == pl.Utf8]
 if text_columns:
     print(f"\n6. TEXT COLUMN ANALYSIS")
+    # Mean/min/max lengths of every text column in a single query
+    length_stats = df.select(
+        [pl.col(c).str.len_chars().mean().alias(f"{c}_mean") for c in text_columns]
+        + [pl.col(c).str.len_chars().min().alias(f"{c}_min") for c in text_columns]
+        + [pl.col(c).str.len_chars().max().alias(f"{c}_max") for c in text_columns]
+    ).row(0, named=True)
     for col in text_columns:
-        df = df.with_columns(
-            pl.col(col).str.len_chars().alias(f"{col}_length")
-        )
-        lengths = df.select(f"{col}_length")
         print(f"\n  {col}:")
-        print(f"    Average length: {lengths.mean().item():.0f} chars")
-        print(f"    Min length: {lengths.min().item()} chars")
-        print(f"    Max length: {lengths.max().item()} chars")
+        print(f"    Average length: {length_stats[f'{col}_mean']:.0f} chars")
+        print(f"    Min length: {length_stats[f'{col}_min']} chars")
+        print(f"    Max length: {length_stats[f'{col}_max']} chars")
 
 print("\n" + "=" * 80)
 print("END OF EXPLORATORY DATA ANALYSIS")
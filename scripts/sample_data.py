@@ -2,8 +2,9 @@
 Create stratified sample of parliamentary speeches for analysis.
 
 This script filters the full dataset to CDU and SPD speeches from 2000 onwards,
-then creates a 50% random sample for computational efficiency while maintaining
-representative distributions.
+then creates a deterministic 50% sample for computational efficiency while
+maintaining representative distributions. The whole pipeline is streamed from
+the input file to the output file, so the full dataset never sits in memory.
 
 Prerequisites:
     - Run import_data.py first to download the full dataset
@@ -15,12 +16,13 @@ Input:
     data/raw/speeches.parquet - Full dataset from HuggingFace
 
 Output:
-    data/raw/df_sample.csv - 50% stratified sample (CDU/SPD, 2000+)
+    data/raw/df_sample.parquet - 50% stratified sample (CDU/SPD, 2000+),
+                                 Zstd-compressed with column statistics
 
 Filtering Criteria:
     - Date >= 2000-01-01
     - factionId in [4 (CDU), 23 (SPD)]
-    - Random 50% sample with seed=42 for reproducibility
+    - 50% sample by hashing the speech id with seed=42 for reproducibility
 """
 
 import polars as pl
@@ -31,32 +33,44 @@ script_dir = Path(__file__).parent
 speeches_path = script_dir.parent / 'data' / 'raw' / 'speeches.parquet'
 
 print(f"Loading data from: {speeches_path}")
-df = pl.read_parquet(speeches_path)
-
-print(f"Total rows in dataset: {df.shape[0]:,}")
-print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-
-# Filter for SPD and CDU/CSU speeches (factionId 4 and 23)
-df_filtered = df.filter(
+lf = pl.scan_parquet(speeches_path)
+
+# Row count and date range in one query (served from Parquet metadata/statistics)
+n_rows, date_min, date_max = lf.select(
+    pl.len(), pl.col('date').min().alias('min'), pl.col('date').max().alias('max')
+).collect().row(0)
+print(f"Total rows in dataset: {n_rows:,}")
+print(f"Date range: {date_min} to {date_max}")
+
+# Filter for SPD and CDU/CSU speeches (factionId 4 and 23) during the scan
+# (date is an ISO-8601 string column, so the comparison is lexicographic)
+lf_filtered = lf.filter(
     (pl.col('date') >= '2000-01-01') & 
-    ((pl.col('factionId') == 23) | (pl.col('factionId') == 4))
+    pl.col('factionId').is_in([4, 23])
 )
 
-print(f"\n✓ Filtered speeches (CDU + SPD, 2000+): {df_filtered.shape[0]:,}")
-
-# Sample 50% of the filtered data
-df_sample = df_filtered.sample(fraction=0.5, seed=42)
-
-print(f"✓ After 50% sampling: {df_sample.shape[0]:,}")
-print(f"  Date range: {df_sample['date'].min()} to {df_sample['date'].max()}")
+# Sample 50% of the filtered data. Hashing the speech id keeps the sample
+# deterministic and streamable, unlike .sample() which materializes the frame.
+lf_sample = lf_filtered.filter(pl.col('id').hash(seed=42) % 2 == 0)
 
 # Save the sample to raw folder (correct location for raw samples)
 raw_dir = script_dir.parent / 'data' / 'raw'
 raw_dir.mkdir(exist_ok=True)
-output_path = raw_dir / 'df_sample.csv'
-df_sample.write_csv(output_path)
+output_path = raw_dir / 'df_sample.parquet'
+lf_sample.sink_parquet(
+    output_path,
+    compression='zstd',
+    compression_level=3,
+    statistics=True  # Row-group min/max stats for predicate pushdown
+)
+
+df_sample = pl.scan_parquet(output_path)
+n_sample, date_min, date_max = df_sample.select(
+    pl.len(), pl.col('date').min().alias('min'), pl.col('date').max().alias('max')
+).collect().row(0)
 
 print(f"\n✓ Sample saved to: {output_path}")
-print(f"  Shape: {df_sample.shape}")
+print(f"  Rows after 50% sampling: {n_sample:,}")
+print(f"  Date range: {date_min} to {date_max}")
 print(f"\nFirst few rows:")
-print(df_sample.head())
+print(df_sample.head().collect())
@@ -4,6 +4,7 @@ Source module for parliamentary speeches analysis.
 This package provides reusable utilities for:
 - Data loading (src.data)
 - Text processing (src.utils)
+- Topic models (src.models)
 
 Example:
     from src.data.load_data import load_speeches
@@ -10,86 +10,152 @@ Functions:
     load_sample: Load the pre-created sample dataset
     load_processed: Load any processed data file
 
+Performance Notes:
+    - load_speeches/load_sample return a LazyFrame by default, so Polars can
+      push column selections and filters down into the file scan
+    - Pass eager=True to get a materialized DataFrame (streaming collect)
+
 Example:
     >>> from src.data.load_data import load_speeches, load_sample
-    >>> df_full = load_speeches()  # Full dataset
-    >>> df_sample = load_sample()  # Pre-filtered sample
+    >>> lf_full = load_speeches()  # Full dataset (lazy)
+    >>> df_sample = load_sample(eager=True)  # Pre-filtered sample
 """
 
+import functools
+
 import polars as pl
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
+
+# Resolved once at import time instead of on every load_* call
+_DATA_DIR = Path(__file__).resolve().parents[2] / 'data'
+_DATA_DIR.mkdir(exist_ok=True)
 
+_SPEECHES_PARQUET = _DATA_DIR / 'raw' / 'speeches.parquet'
+_SPEECHES_CSV = _DATA_DIR / 'raw' / 'speeches.csv'
+_SAMPLE_PARQUET = _DATA_DIR / 'raw' / 'df_sample.parquet'
+_SAMPLE_CSV = _DATA_DIR / 'raw' / 'df_sample.csv'
+_CLEANED_CSV = _DATA_DIR / 'processed' / 'df_sample_cleaned.csv'
 
+
+@functools.cache
 def get_data_dir() -> Path:
     """
-    Get the data directory path, creating it if it doesn't exist.
+    Get the data directory path (created at import time if it doesn't exist).
     
     Returns:
         Path to the data/ directory relative to project root
     """
-    data_dir = Path(__file__).parent.parent.parent / 'data'
-    data_dir.mkdir(exist_ok=True)
-    return data_dir
+    return _DATA_DIR
 
 
-def load_speeches(source: str = 'parquet') -> pl.DataFrame:
+def _finalize(
+    lf: pl.LazyFrame,
+    columns: Optional[List[str]],
+    eager: bool
+) -> Union[pl.LazyFrame, pl.DataFrame]:
+    """
+    Apply an optional column projection and optionally collect a LazyFrame.
+    
+    Args:
+        lf: LazyFrame returned by a scan_* call
+        columns: Columns to keep, or None for all columns
+        eager: If True, collect with the streaming engine
+        
+    Returns:
+        LazyFrame, or DataFrame if eager is True
+    """
+    if columns:
+        lf = lf.select(columns)
+    if eager:
+        return lf.collect(engine='streaming')
+    return lf
+
+
+def load_speeches(
+    source: str = 'parquet',
+    columns: Optional[List[str]] = None,
+    eager: bool = False
+) -> Union[pl.LazyFrame, pl.DataFrame]:
     """
     Load the full speeches dataset.
     
+    The file is scanned lazily, so selections and filters applied by the
+    caller are pushed down into the reader before any data is loaded.
+    REQUIRED_COLUMNS (config.model_params) is currently the full schema, so
+    passing it as columns does not reduce I/O; pass a narrower list to read
+    fewer column chunks.
+    
     Args:
         source: Either 'parquet' or 'csv' to specify the file format
+        columns: Optional list of columns to read (default: all columns)
+        eager: If True, collect and return a DataFrame (default: False)
         
     Returns:
-        Polars DataFrame containing the speeches data
+        Polars LazyFrame (or DataFrame if eager=True) containing the speeches data
         
     Raises:
         FileNotFoundError: If the data file doesn't exist
         ValueError: If source is not 'parquet' or 'csv'
         
     Example:
-        >>> df = load_speeches('parquet')
+        >>> lf = load_speeches('parquet')
+        >>> df = lf.filter(pl.col('factionId') == 4).collect()
         >>> print(f"Loaded {df.shape[0]} speeches")
     """
     if source not in ['parquet', 'csv']:
         raise ValueError(f"source must be 'parquet' or 'csv', got {source}")
     
-    data_dir = get_data_dir()
-    
-    if source == 'parquet':
-        file_path = data_dir / 'raw' / 'speeches.parquet'
-    else:
-        file_path = data_dir / 'raw' / 'speeches.csv'
+    file_path = _SPEECHES_PARQUET if source == 'parquet' else _SPEECHES_CSV
     
     if not file_path.exists():
         raise FileNotFoundError(f"Data file not found: {file_path}")
     
     if source == 'parquet':
-        return pl.read_parquet(file_path)
+        lf = pl.scan_parquet(file_path)
     else:
-        return pl.read_csv(file_path)
+        lf = pl.scan_csv(file_path)
+    
+    return _finalize(lf, columns, eager)
 
 
-def load_sample(source: str = 'csv') -> pl.DataFrame:
+def load_sample(
+    source: str = 'auto',
+    columns: Optional[List[str]] = None,
+    eager: bool = False
+) -> Union[pl.LazyFrame, pl.DataFrame]:
     """
-    Load the sample dataset (100 rows) from data/raw/df_sample.csv.
+    Load the sample dataset from data/raw/df_sample.parquet (or .csv).
     
     Args:
-        source: Either 'csv' for the sample file
+        source: 'auto' (default: parquet if present, else csv), 'parquet', or 'csv'
+        columns: Optional list of columns to read (default: all columns)
+        eager: If True, collect and return a DataFrame (default: False)
         
     Returns:
-        Polars DataFrame containing the sample data
+        Polars LazyFrame (or DataFrame if eager=True) containing the sample data
         
     Raises:
         FileNotFoundError: If the sample file doesn't exist
+        ValueError: If source is not 'auto', 'parquet' or 'csv'
     """
-    data_dir = get_data_dir()
-    file_path = data_dir / 'raw' / 'df_sample.csv'
+    if source not in ['auto', 'parquet', 'csv']:
+        raise ValueError(f"source must be 'auto', 'parquet' or 'csv', got {source}")
+    
+    if source == 'auto':
+        source = 'parquet' if _SAMPLE_PARQUET.exists() else 'csv'
+    
+    file_path = _SAMPLE_PARQUET if source == 'parquet' else _SAMPLE_CSV
     
     if not file_path.exists():
         raise FileNotFoundError(f"Sample file not found: {file_path}")
     
-    return pl.read_csv(file_path)
+    if source == 'parquet':
+        lf = pl.scan_parquet(file_path)
+    else:
+        lf = pl.scan_csv(file_path)
+    
+    return _finalize(lf, columns, eager)
 
 
 def load_cleaned() -> pl.DataFrame:
@@ -102,8 +168,7 @@ def load_cleaned() -> pl.DataFrame:
     Raises:
         FileNotFoundError: If the cleaned file doesn't exist
     """
-    data_dir = get_data_dir()
-    file_path = data_dir / 'processed' / 'df_sample_cleaned.csv'
+    file_path = _CLEANED_CSV
     
     if not file_path.exists():
         raise FileNotFoundError(f"Cleaned dataset not found: {file_path}. Please run the data cleaning notebook first.")
@@ -111,33 +176,40 @@ def load_cleaned() -> pl.DataFrame:
     return pl.read_csv(file_path)
 
 
-def load_data(use_sample: bool = False, source: str = 'auto') -> pl.DataFrame:
+def load_data(
+    use_sample: bool = False,
+    source: str = 'auto',
+    columns: Optional[List[str]] = None,
+    eager: bool = False
+) -> Union[pl.LazyFrame, pl.DataFrame]:
     """
     Convenience function to load data.
     
     Args:
         use_sample: If True, load sample data. If False (default), load full dataset.
-        source: 'auto' (default parquet for full, csv for sample), 
+        source: 'auto' (default parquet, sample falls back to csv), 
                 'parquet', or 'csv'
+        columns: Optional list of columns to read (default: all columns)
+        eager: If True, collect and return a DataFrame (default: False)
         
     Returns:
-        Polars DataFrame
+        Polars LazyFrame (or DataFrame if eager=True)
     """
     if use_sample:
-        return load_sample()
+        return load_sample(source=source, columns=columns, eager=eager)
     else:
         if source == 'auto':
             source = 'parquet'
-        return load_speeches(source=source)
+        return load_speeches(source=source, columns=columns, eager=eager)
 
 
 if __name__ == '__main__':
     # Example usage
     print("Loading sample data...")
-    df_sample = load_sample()
+    df_sample = load_sample(eager=True)
     print(f"Sample shape: {df_sample.shape}")
     print(df_sample.head())
     
     print("\nLoading full dataset...")
-    df_full = load_speeches()
-    print(f"Full dataset shape: {df_full.shape}")
+    lf_full = load_speeches()
+    print(f"Full dataset columns: {lf_full.collect_schema().names()}")
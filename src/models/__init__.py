@@ -0,0 +1,2 @@
+"""Topic model module."""
+from .lda import *
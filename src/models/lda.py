@@ -0,0 +1,128 @@
+"""
+LDA topic modeling with gensim's multicore trainer.
+
+scikit-learn's online LDA only parallelizes the E-step, so most of the EM
+iteration runs on one core. gensim's LdaMulticore distributes the E-step
+over worker processes per chunk of documents, which scales much better on
+large corpora. The functions here take the sparse document-term matrix from
+a CountVectorizer (see src.utils.vectorizer_cache) so the existing
+vectorization step is reused unchanged.
+
+Functions:
+    vocabulary_to_id2word: Build a gensim id2word mapping from a vectorizer
+    fit_lda: Fit an LdaMulticore model on a document-term matrix
+    tune_chunksize: Pick the chunk size with the best training throughput
+
+Example:
+    >>> from config.model_params import COUNT_VECTORIZER_PARAMS
+    >>> from src.utils.vectorizer_cache import fit_or_load_count
+    >>> from src.models.lda import fit_lda, vocabulary_to_id2word
+    >>> vectorizer, dtm = fit_or_load_count(texts, COUNT_VECTORIZER_PARAMS)
+    >>> lda = fit_lda(dtm, id2word=vocabulary_to_id2word(vectorizer))
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+from config.model_params import (
+    LDA_CHUNKSIZE_CANDIDATES,
+    LDA_MULTICORE_PARAMS,
+    LDA_PARAMS,
+)
+
+
+def vocabulary_to_id2word(vectorizer) -> Dict[int, str]:
+    """
+    Map column indices of a fitted scikit-learn vectorizer to terms.
+
+    Args:
+        vectorizer: Fitted CountVectorizer or TfidfVectorizer
+
+    Returns:
+        Dict of column index -> term, usable as gensim's id2word
+    """
+    return dict(enumerate(vectorizer.get_feature_names_out()))
+
+
+def _default_workers() -> int:
+    """Use all cores but one (gensim's main process also needs a core)."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def fit_lda(
+    dtm,
+    n_topics: int = LDA_PARAMS['n_topics'],
+    workers: Optional[int] = None,
+    chunksize: int = LDA_MULTICORE_PARAMS['chunksize'],
+    passes: int = LDA_MULTICORE_PARAMS['passes'],
+    id2word: Optional[Dict[int, str]] = None,
+    random_state: int = LDA_PARAMS['random_state']
+):
+    """
+    Fit a gensim LdaMulticore model on a sparse document-term matrix.
+
+    Args:
+        dtm: Sparse (n_docs, n_terms) document-term matrix, e.g. from a
+            CountVectorizer
+        n_topics: Number of latent topics (default: LDA_PARAMS['n_topics'])
+        workers: Worker processes (default: os.cpu_count() - 1)
+        chunksize: Documents per training chunk (see tune_chunksize)
+        passes: Passes over the corpus
+        id2word: Column index -> term mapping (see vocabulary_to_id2word)
+        random_state: Reproducibility seed
+
+    Returns:
+        Fitted gensim LdaMulticore model
+    """
+    from gensim.matutils import Sparse2Corpus
+    from gensim.models import LdaMulticore
+
+    corpus = Sparse2Corpus(dtm, documents_columns=False)
+
+    return LdaMulticore(
+        corpus,
+        num_topics=n_topics,
+        id2word=id2word,
+        workers=workers or _default_workers(),
+        chunksize=chunksize,
+        passes=passes,
+        random_state=random_state,
+        eval_every=None  # Perplexity evaluation is slow and not needed here
+    )
+
+
+def tune_chunksize(
+    dtm,
+    candidates: List[int] = LDA_CHUNKSIZE_CANDIDATES,
+    n_topics: int = LDA_PARAMS['n_topics'],
+    workers: Optional[int] = None,
+    id2word: Optional[Dict[int, str]] = None
+) -> int:
+    """
+    Time one training pass per chunk size and return the fastest.
+
+    Args:
+        dtm: Sparse (n_docs, n_terms) document-term matrix
+        candidates: Chunk sizes to try (default: LDA_CHUNKSIZE_CANDIDATES)
+        n_topics: Number of latent topics
+        workers: Worker processes (default: os.cpu_count() - 1)
+        id2word: Column index -> term mapping
+
+    Returns:
+        Chunk size with the highest documents/second
+    """
+    n_docs = dtm.shape[0]
+    best_chunksize, best_throughput = candidates[0], 0.0
+
+    for chunksize in candidates:
+        start = time.perf_counter()
+        fit_lda(dtm, n_topics=n_topics, workers=workers, chunksize=chunksize,
+                passes=1, id2word=id2word)
+        throughput = n_docs / (time.perf_counter() - start)
+        print(f"  chunksize={chunksize}: {throughput:,.0f} docs/sec")
+
+        if throughput > best_throughput:
+            best_chunksize, best_throughput = chunksize, throughput
+
+    return best_chunksize
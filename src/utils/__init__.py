@@ -1,2 +1,4 @@
 """Utility functions module."""
 from .text_processing import *
+from .quantize import *
+from .vectorizer_cache import *
@@ -12,8 +12,17 @@ Performance Notes:
 
 Functions:
     trim_to_max_words_native: Trim text to maximum word count
+    trim_to_max_chars: Trim text to a character budget at a word boundary
     add_word_count: Add word count column
     add_char_count: Add character count column
+    split_text_to_rows: Split text into one row per segment
+    hash_text: Fast non-cryptographic hash of a text
+    deduplicate: Drop rows with duplicate text
+    tune_batch_size: Pick a sentiment batch size for the current device
+    tokenizer_fingerprint: Identify a tokenizer for cache namespacing
+    TokenizedCache: On-disk cache of tokenized texts
+    batch_process_sentiment: Run sentiment inference in batches
+    preload_models: Download the BERT models into the HuggingFace cache
 
 Example:
     >>> import polars as pl
@@ -22,8 +31,30 @@ Example:
     >>> df_trimmed = trim_to_max_words_native(df, 'text', max_words=50)
 """
 
+import contextlib
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import polars as pl
-from typing import List, Tuple
+import xxhash
+from typing import Callable, List, Optional, Tuple, Union
+
+from config.model_params import (
+    BERT_TOPIC_MODEL,
+    MAX_CHARS_PER_PARAGRAPH,
+    SENTIMENT_BATCH_SIZE_CANDIDATES_CPU,
+    SENTIMENT_BATCH_SIZE_CPU,
+    SENTIMENT_BATCH_SIZE_GPU,
+    SENTIMENT_BATCH_SIZE_START,
+    SENTIMENT_GPU_MEMORY_LIMIT_FRAC,
+    SENTIMENT_MODEL,
+)
+from .quantize import quantize_sentiment_model
+
+#: Default on-disk cache location (project_root/cache)
+CACHE_DIR = Path(__file__).resolve().parents[2] / 'cache'
 
 
 def trim_to_max_words_native(
@@ -34,11 +65,13 @@ def trim_to_max_words_native(
     """
     Trim text column to maximum number of words using native Polars operations.
     
-    This implementation uses Polars' built-in string operations which are
-    significantly faster than Python UDFs (10-100x speedup).
+    Words are split on single spaces and the first max_words are rejoined.
+    For an eager DataFrame, a cheap space count is run first and the frame is
+    returned unchanged if no row needs trimming; a LazyFrame just gets the
+    trim expression added to its plan.
     
     Args:
-        df: Input Polars DataFrame
+        df: Input Polars DataFrame or LazyFrame
         col: Name of the text column to trim
         max_words: Maximum number of words to keep (default: 300)
         
@@ -51,11 +84,65 @@ def trim_to_max_words_native(
         >>> len(df_trimmed['speech'][0].split())
         100
     """
+    # Keeping no words leaves an empty string (nulls stay null)
+    if max_words <= 0:
+        return df.with_columns(
+            pl.when(pl.col(col).is_not_null()).then(pl.lit('')).alias(col)
+        )
+    
+    n_spaces = pl.col(col).str.count_matches(' ', literal=True)
+    
+    # Fast path: nothing to trim (a LazyFrame would have to be collected)
+    if isinstance(df, pl.DataFrame):
+        max_spaces = df.select(n_spaces.max()).item()
+        if max_spaces is None or max_spaces < max_words:
+            return df
+    
+    # Splitting and rejoining on ' ' leaves shorter rows unchanged
     return df.with_columns(
-        pl.col(col)
-        .str.split(' ')           # Split into list of words
-        .list.head(max_words)     # Take first max_words elements
-        .list.join(' ')           # Join back into string
+        pl.col(col).str.split(' ').list.head(max_words).list.join(' ')
+    )
+
+
+def trim_to_max_chars(
+    df: pl.DataFrame, 
+    col: str, 
+    max_chars: int = MAX_CHARS_PER_PARAGRAPH
+) -> pl.DataFrame:
+    """
+    Trim text column to at most max_chars characters without cutting words.
+    
+    Suited for sentiment preprocessing, where BERT models only need the text
+    to fit a token budget (the default of 2000 characters is roughly 512
+    tokens). Unlike trim_to_max_words_native, no word list is built: the
+    text is sliced and a single regex pass walks back to the last whitespace.
+    Keep trim_to_max_words_native where exact word counts matter.
+    
+    Args:
+        df: Input Polars DataFrame
+        col: Name of the text column to trim
+        max_chars: Maximum number of characters to keep (default: 2000)
+        
+    Returns:
+        DataFrame with the specified column trimmed to max_chars
+        
+    Example:
+        >>> df = pl.DataFrame({'speech': ['word ' * 1000]})
+        >>> df_trimmed = trim_to_max_chars(df, 'speech', max_chars=12)
+        >>> df_trimmed['speech'][0]
+        'word word'
+    """
+    # One extra character tells whether the cut falls on a word boundary
+    head = pl.col(col).str.slice(0, max_chars + 1)
+    
+    return df.with_columns(
+        pl.when(pl.col(col).str.len_chars() <= max_chars)
+        .then(pl.col(col))
+        .otherwise(
+            # Up to the last word that ends before whitespace; null if none
+            head.str.extract(r'(?s)^(.*\S)\s', 1)
+            .fill_null(pl.col(col).str.slice(0, max_chars))  # Single long word
+        )
         .alias(col)
     )
 
@@ -68,6 +155,9 @@ def add_word_count(
     """
     Add a column with word counts for each row.
     
+    Words are counted as spaces + 1 without splitting the text into a list;
+    empty strings count as 0 words.
+    
     Args:
         df: Input Polars DataFrame
         text_col: Name of the text column to count words in
@@ -83,7 +173,10 @@ def add_word_count(
         [2, 3]
     """
     return df.with_columns(
-        pl.col(text_col).str.split(' ').list.len().alias(count_col)
+        pl.when(pl.col(text_col).str.len_bytes() == 0)
+        .then(0)
+        .otherwise(pl.col(text_col).str.count_matches(' ', literal=True) + 1)
+        .alias(count_col)
     )
 
 
@@ -113,6 +206,9 @@ def split_text_to_rows(df: pl.DataFrame, text_col: str, delimiter: str = '\n\n')
     Split text column by delimiter and explode into rows.
     Much faster than iterating in Python.
     
+    Segments are stripped and empty segments dropped inside each list before
+    exploding, so the exploded frame only ever holds non-empty segments.
+    
     Args:
         df: Polars DataFrame
         text_col: Name of the text column to split
@@ -124,51 +220,562 @@ def split_text_to_rows(df: pl.DataFrame, text_col: str, delimiter: str = '\n\n')
     return (
         df
         .with_columns(
-            pl.col(text_col).str.split(delimiter).alias('_segments')
+            pl.col(text_col)
+            .str.split(delimiter)
+            .list.eval(pl.element().str.strip_chars())
+            .list.eval(pl.element().filter(pl.element().str.len_bytes() > 0))
+            .alias(text_col)
         )
-        .explode('_segments')
-        .with_columns(
-            pl.col('_segments').str.strip_chars().alias(text_col)
+        .explode(text_col)
+        .drop_nulls(text_col)  # Rows with no non-empty segments explode to null
+    )
+
+
+def hash_text(text: str) -> int:
+    """
+    Hash a text with xxh3 (64-bit), e.g. for cache keys.
+    
+    xxh3 is non-cryptographic and far faster than hashlib on long speeches,
+    which is all that is needed for keying and deduplication.
+    
+    Args:
+        text: Text to hash
+        
+    Returns:
+        Unsigned 64-bit hash
+    """
+    return xxhash.xxh3_64_intdigest(text.encode())
+
+
+def deduplicate(df: pl.DataFrame, text_col: str) -> pl.DataFrame:
+    """
+    Drop rows whose text is a duplicate of an earlier row.
+    
+    Compares the texts themselves (Polars hashes them internally), so
+    distinct speeches are never dropped because of a hash collision.
+    
+    Args:
+        df: Polars DataFrame
+        text_col: Name of the text column to deduplicate on
+        
+    Returns:
+        DataFrame keeping the first occurrence of each text, in input order
+    """
+    return df.unique(subset=text_col, keep='first', maintain_order=True)
+
+
+def _resolve_device(device: Optional[str] = None) -> str:
+    """Return device, defaulting to 'cuda' if available and 'cpu' otherwise."""
+    if device is None:
+        import torch
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    return device
+
+
+def _prepare_model(model, device: str, quantized: bool = False):
+    """
+    Return the SentimentModel handle to run inference with on device.
+    
+    With quantized=True on CPU, this is a copy of model running its int8 ONNX
+    version (see src.utils.quantize); the caller's model is left unchanged.
+    If optimum is not installed or the export fails, a warning is issued and
+    the PyTorch model is used instead. PyTorch networks are moved to device
+    and switched to eval mode in place.
+    """
+    import torch
+    
+    if quantized and device == 'cpu':
+        try:
+            return quantize_sentiment_model(model)
+        except ImportError:
+            warnings.warn("optimum[onnxruntime] is not installed; using the unquantized model")
+        except Exception as exc:
+            warnings.warn(f"Quantizing the sentiment model failed ({exc}); using the unquantized model")
+    
+    if isinstance(model.model, torch.nn.Module):
+        model.model.to(device).eval()
+    model.device = device
+    return model
+
+
+def _inference_context(device: str) -> contextlib.ExitStack:
+    """
+    Context for inference: no autograd, and mixed precision on CUDA.
+    
+    On CUDA, matmuls run under autocast in bfloat16 (float16 on GPUs without
+    bfloat16 support). On CPU the model stays in float32.
+    """
+    import torch
+    
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    if device == 'cuda':
+        dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        stack.enter_context(torch.autocast(device_type='cuda', dtype=dtype))
+    return stack
+
+
+def tune_batch_size(
+    model,
+    sample_texts: list,
+    device: Optional[str] = None,
+    memory_limit_frac: float = SENTIMENT_GPU_MEMORY_LIMIT_FRAC
+) -> int:
+    """
+    Find a sentiment batch size by timing forward passes on sample texts.
+    
+    On CUDA the batch size is doubled from SENTIMENT_BATCH_SIZE_START while
+    throughput improves by more than 5%, peak memory stays below
+    memory_limit_frac of the device memory and the size stays within
+    SENTIMENT_BATCH_SIZE_GPU. An out-of-memory error backs off to the last
+    size that worked. On CPU, where small batches tend to win, the sizes in
+    SENTIMENT_BATCH_SIZE_CANDIDATES_CPU are swept and the fastest is kept.
+    
+    Args:
+        model: SentimentModel instance
+        sample_texts: Texts used for the probe (cycled to fill each batch);
+            pass the longest texts to size for the worst case
+        device: 'cuda' or 'cpu' (default: 'cuda' if available)
+        memory_limit_frac: Maximum fraction of GPU memory to use
+        
+    Returns:
+        Batch size with the best measured throughput
+        (SENTIMENT_BATCH_SIZE_START if sample_texts is empty)
+    """
+    if not sample_texts:
+        return SENTIMENT_BATCH_SIZE_START
+    
+    import torch
+    
+    device = _resolve_device(device)
+    
+    def throughput(size: int) -> float:
+        batch = [sample_texts[i % len(sample_texts)] for i in range(size)]
+        start = time.perf_counter()
+        with _inference_context(device):
+            model.predict_sentiment(batch)
+        if device == 'cuda':
+            torch.cuda.synchronize()
+        return size / (time.perf_counter() - start)
+    
+    # Warm-up pass so one-off initialization is not timed
+    throughput(1)
+    
+    if device != 'cuda':
+        candidates = [s for s in SENTIMENT_BATCH_SIZE_CANDIDATES_CPU if s <= SENTIMENT_BATCH_SIZE_CPU]
+        return max(candidates, key=throughput)
+    
+    _, total_bytes = torch.cuda.mem_get_info()
+    best_size, best_throughput = 1, 0.0
+    size = SENTIMENT_BATCH_SIZE_START
+    
+    while size <= SENTIMENT_BATCH_SIZE_GPU:
+        torch.cuda.reset_peak_memory_stats()
+        try:
+            current = throughput(size)
+        except torch.cuda.OutOfMemoryError:
+            torch.cuda.empty_cache()
+            break
+        
+        if current <= best_throughput * 1.05:
+            break
+        best_size, best_throughput = size, current
+        
+        if torch.cuda.max_memory_allocated() / total_bytes >= memory_limit_frac:
+            break
+        size *= 2
+    
+    return best_size
+
+
+class Lazy:
+    """
+    Defer construction of an expensive object until it is first used.
+    
+    Calling a Lazy instance constructs the wrapped object (once) and calls it,
+    so a Lazy tokenizer can be passed wherever a tokenizer is expected.
+    
+    Example:
+        >>> from transformers import AutoTokenizer
+        >>> tokenizer = Lazy(lambda: AutoTokenizer.from_pretrained(BERT_TOPIC_MODEL))
+    """
+    
+    def __init__(self, factory: Callable):
+        self._factory = factory
+        self._value = None
+    
+    def get(self):
+        """Return the wrapped object, constructing it on first access."""
+        if self._value is None:
+            self._value = self._factory()
+        return self._value
+    
+    def __call__(self, *args, **kwargs):
+        return self.get()(*args, **kwargs)
+
+
+def tokenizer_fingerprint(tokenizer, *extra) -> str:
+    """
+    Identify a tokenizer by its name, vocabulary and truncation length.
+    
+    Two tokenizers with the same fingerprint produce the same token ids, so
+    the fingerprint namespaces TokenizedCache files.
+    
+    Args:
+        tokenizer: HuggingFace tokenizer, or a Lazy wrapping one (which is
+            constructed to read its vocabulary)
+        *extra: Additional settings that change the ids (e.g. preprocessing)
+        
+    Returns:
+        16-character hex string
+    """
+    if isinstance(tokenizer, Lazy):
+        tokenizer = tokenizer.get()
+    vocab = sorted(tokenizer.get_vocab().items())
+    parts = [
+        getattr(tokenizer, 'name_or_path', ''),
+        str(getattr(tokenizer, 'model_max_length', '')),
+        repr(vocab),
+        *map(str, extra),
+    ]
+    return f"{hash_text('|'.join(parts)):016x}"
+
+
+class TokenizedCache:
+    """
+    On-disk cache of tokenized texts keyed by a content hash (hash_text).
+    
+    Entries are stored in one Parquet file per tokenizer with columns
+    (hash, input_ids, attention_mask). Files are namespaced by
+    tokenizer_fingerprint, so different tokenizers never share ids. Only
+    texts missing from the cache are tokenized, so reruns over the same
+    texts skip tokenization entirely.
+    
+    Args:
+        path: Base Parquet path; the namespace is appended to the file name
+            (default: cache/tokens.parquet -> cache/tokens-<namespace>.parquet)
+        
+    Example:
+        >>> cache = TokenizedCache()
+        >>> encoded = cache.encode(texts, model.tokenizer)
+        >>> encoded['input_ids'].to_list()
+    """
+    
+    SCHEMA = {
+        'hash': pl.UInt64,
+        'input_ids': pl.List(pl.UInt32),
+        'attention_mask': pl.List(pl.UInt8),
+    }
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / 'tokens.parquet'
+    
+    def path_for(self, namespace: str) -> Path:
+        """Return the cache file for a namespace."""
+        return self.path.with_name(f"{self.path.stem}-{namespace}{self.path.suffix}")
+    
+    def load(self, namespace: str) -> pl.DataFrame:
+        """
+        Load all cached entries of a namespace.
+        
+        Returns an empty DataFrame if no cache file exists, or if the file was
+        written with a different schema (e.g. older string hash keys).
+        """
+        path = self.path_for(namespace)
+        if path.exists():
+            cached = pl.read_parquet(path)
+            if cached.schema == pl.Schema(self.SCHEMA):
+                return cached
+        return pl.DataFrame(schema=self.SCHEMA)
+    
+    def encode(
+        self,
+        texts: List[str],
+        tokenizer: Callable,
+        namespace: Optional[str] = None
+    ) -> pl.DataFrame:
+        """
+        Tokenize texts, reading hits from the cache and appending misses.
+        
+        Args:
+            texts: List of text strings
+            tokenizer: Callable mapping a list of texts to a dict with
+                'input_ids' and 'attention_mask' (e.g. a HuggingFace tokenizer
+                or a Lazy wrapping one); only called on cache misses
+            namespace: Cache namespace (default: tokenizer_fingerprint of
+                tokenizer). Required when tokenizer is a plain function; pass
+                it explicitly to keep a Lazy tokenizer unconstructed on hits
+                
+        Returns:
+            DataFrame with columns (hash, input_ids, attention_mask), one row
+            per input text in input order
+        """
+        if namespace is None:
+            namespace = tokenizer_fingerprint(tokenizer)
+        
+        keys = pl.DataFrame(
+            {'hash': [hash_text(t) for t in texts]}, schema={'hash': pl.UInt64}
+        ).with_row_index('_row')
+        cached = self.load(namespace)
+        
+        misses = (
+            keys.join(cached.select('hash'), on='hash', how='anti')
+            .unique(subset='hash', keep='first')
+        )
+        if misses.height > 0:
+            miss_texts = [texts[i] for i in misses['_row']]
+            encoded = tokenizer(miss_texts)
+            new_entries = pl.DataFrame({
+                'hash': misses['hash'],
+                'input_ids': encoded['input_ids'],
+                'attention_mask': encoded['attention_mask'],
+            }, schema=self.SCHEMA)
+            cached = pl.concat([cached, new_entries])
+            path = self.path_for(namespace)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            cached.write_parquet(path)
+        
+        return (
+            keys.join(cached, on='hash', how='left')
+            .sort('_row')
+            .drop('_row')
         )
-        .drop('_segments')
-        .filter(pl.col(text_col).str.len_chars() > 0)  # Remove empty rows
+
+
+def _tokenize_batch(model, texts: List[str], pin_memory: bool = False) -> dict:
+    """
+    Clean and tokenize texts the same way SentimentModel.predict_sentiment does.
+    
+    Args:
+        model: SentimentModel instance
+        texts: Texts in the batch
+        pin_memory: Pin the tensors in page-locked memory for async GPU copies
+        
+    Returns:
+        Dict of padded tensors (input_ids, attention_mask, ...)
+    """
+    encoded = model.tokenizer(
+        [model.clean_text(t) for t in texts],
+        padding=True,
+        add_special_tokens=True,
+        truncation=True,
+        return_tensors='pt'
     )
+    encoded = dict(encoded)
+    if pin_memory:
+        encoded = {k: v.pin_memory() for k, v in encoded.items()}
+    return encoded
+
+
+def _pad_token_ids(
+    model,
+    input_ids: List[List[int]],
+    attention_mask: List[List[int]],
+    pin_memory: bool = False
+) -> dict:
+    """
+    Pad pre-tokenized inputs (e.g. from TokenizedCache) into batch tensors.
+    
+    Args:
+        model: SentimentModel instance
+        input_ids: Token ids per text (unpadded)
+        attention_mask: Attention mask per text (unpadded)
+        pin_memory: Pin the tensors in page-locked memory for async GPU copies
+        
+    Returns:
+        Dict of padded tensors (input_ids, attention_mask, token_type_ids)
+    """
+    import torch
+    
+    max_len = max(len(ids) for ids in input_ids)
+    pad_id = model.tokenizer.pad_token_id
+    ids_tensor = torch.tensor([ids + [pad_id] * (max_len - len(ids)) for ids in input_ids])
+    mask_tensor = torch.tensor([mask + [0] * (max_len - len(mask)) for mask in attention_mask])
+    encoded = {
+        'input_ids': ids_tensor,
+        'attention_mask': mask_tensor,
+        'token_type_ids': torch.zeros_like(ids_tensor),
+    }
+    if pin_memory:
+        encoded = {k: v.pin_memory() for k, v in encoded.items()}
+    return encoded
+
+
+def _predict_encoded(model, encoded: dict):
+    """
+    Run a SentimentModel on a tokenized batch.
+    
+    Mirrors SentimentModel.predict_sentiment(..., output_probabilities=True)
+    but skips text cleaning and tokenization.
+    
+    Args:
+        model: SentimentModel instance
+        encoded: Dict of padded tensors from _tokenize_batch or _pad_token_ids
+        
+    Returns:
+        Tuple of (classes list, probabilities list)
+    """
+    import torch
+    
+    # non_blocking lets the host->device copy of pinned tensors overlap
+    encoded = {k: v.to(model.device, non_blocking=True) for k, v in encoded.items()}
+    
+    with torch.no_grad():
+        logits = model.model(**encoded).logits
+    
+    id2label = model.model.config.id2label
+    classes = [id2label[i] for i in logits.argmax(dim=1).tolist()]
+    probabilities = [
+        [[id2label[j], p] for j, p in enumerate(row)]
+        for row in torch.softmax(logits.float(), dim=-1).tolist()
+    ]
+    return classes, probabilities
 
 
-def batch_process_sentiment(texts: list, model, batch_size: int = 32, show_progress: bool = True):
+def batch_process_sentiment(
+    texts: list,
+    model,
+    batch_size: Union[int, str] = 32,
+    show_progress: bool = True,
+    cache: Optional[TokenizedCache] = None,
+    device: Optional[str] = None,
+    quantized: bool = True
+):
     """
     Process sentiment in batches for better performance.
     
+    Texts are sorted by length before batching, so each batch holds similarly
+    sized texts and is padded less. Results are returned in the original
+    order of texts. If a TokenizedCache is given, texts are tokenized through
+    the cache and the model runs directly on the cached token ids.
+    
+    The next batch is tokenized (or padded) in a background thread while the
+    model runs on the current one, so CPU tokenization overlaps with the
+    forward pass. On CUDA the prepared tensors are pinned and copied to the
+    GPU asynchronously.
+    
+    The model is moved to device and run under torch.inference_mode; on CUDA
+    it additionally runs under bfloat16 autocast. On CPU the int8 quantized
+    ONNX model is preferred when quantized=True: inference runs on a copy of
+    model, so the caller's model (and later predict_sentiment calls) keep
+    the original weights. The first quantized run per model does a one-off
+    ONNX export, cached under models/quantized/.
+    
     Args:
         texts: List of text strings
         model: SentimentModel instance
-        batch_size: Number of texts to process at once
+        batch_size: Number of texts to process at once, or 'auto' to pick
+            one with tune_batch_size
         show_progress: Whether to show progress bar
+        cache: Optional TokenizedCache to reuse tokenization across runs
+        device: 'cuda' or 'cpu' (default: 'cuda' if available)
+        quantized: Use the int8 ONNX model on CPU, falling back to PyTorch
+            with a warning if it can't be built (default: True)
         
     Returns:
         Tuple of (sentiments list, probabilities list)
     """
     from tqdm import tqdm
     
-    sentiments = []
-    probabilities_list = []
+    device = _resolve_device(device)
+    model = _prepare_model(model, device, quantized=quantized)
+    
+    sentiments = [None] * len(texts)
+    probabilities_list = [None] * len(texts)
+    
+    if cache is not None:
+        encoded = cache.encode(
+            texts,
+            lambda batch: model.tokenizer(
+                [model.clean_text(t) for t in batch], add_special_tokens=True, truncation=True
+            ),
+            namespace=tokenizer_fingerprint(model.tokenizer, 'SentimentModel.clean_text')
+        )
+        input_ids = encoded['input_ids'].to_list()
+        attention_mask = encoded['attention_mask'].to_list()
+        lengths = [len(ids) for ids in input_ids]
+    else:
+        lengths = [t.count(' ') for t in texts]
+    
+    # Sort indices by length so batches contain similarly sized texts
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+    
+    if batch_size == 'auto':
+        longest = [texts[i] for i in order[-SENTIMENT_BATCH_SIZE_GPU:]]
+        batch_size = tune_batch_size(model, longest, device=device)
+        if show_progress:
+            print(f"Tuned batch size: {batch_size}")
+    
+    chunks = [order[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    total_batches = len(chunks)
+    pin_memory = device == 'cuda'
     
-    total_batches = (len(texts) + batch_size - 1) // batch_size
+    def prepare(chunk: List[int]) -> dict:
+        if cache is not None:
+            return _pad_token_ids(
+                model,
+                [input_ids[j] for j in chunk],
+                [attention_mask[j] for j in chunk],
+                pin_memory=pin_memory
+            )
+        return _tokenize_batch(model, [texts[j] for j in chunk], pin_memory=pin_memory)
     
     # Create iterator with optional progress bar
-    batch_iterator = range(0, len(texts), batch_size)
+    batch_iterator = range(total_batches)
     if show_progress:
-        batch_iterator = tqdm(batch_iterator, total=total_batches, desc="Sentiment analysis")
+        # Cap refresh rate so progress output does not slow down small batches
+        batch_iterator = tqdm(
+            batch_iterator,
+            total=total_batches,
+            desc="Sentiment analysis",
+            mininterval=0.5,
+            miniters=max(1, total_batches // 100)
+        )
     
-    for i in batch_iterator:
-        batch = texts[i:i + batch_size]
-        
-        # Process batch
-        classes, probs = model.predict_sentiment(batch, output_probabilities=True)
-        sentiments.extend(classes)
-        probabilities_list.extend(probs)
+    # A single background worker keeps exactly one batch prepared ahead
+    with ThreadPoolExecutor(max_workers=1) as executor, _inference_context(device):
+        future = executor.submit(prepare, chunks[0]) if chunks else None
+        for k in batch_iterator:
+            batch_inputs = future.result()
+            if k + 1 < total_batches:
+                future = executor.submit(prepare, chunks[k + 1])
+            
+            # Process batch and scatter results back to original positions
+            classes, probs = _predict_encoded(model, batch_inputs)
+            for j, cls, prob in zip(chunks[k], classes, probs):
+                sentiments[j] = cls
+                probabilities_list[j] = prob
     
     if show_progress:
         print(f"\n✓ Processed {len(texts)} texts in {total_batches} batches")
     
     return sentiments, probabilities_list
+
+
+def preload_models(
+    model_names: Optional[List[str]] = None,
+    force_download: bool = False
+) -> None:
+    """
+    Download model weights and tokenizers into the HuggingFace cache.
+    
+    Run once at setup time so later notebook runs load from the local cache
+    instead of the network. Downloads use hf_transfer when it is installed
+    (see config.model_params).
+    
+    Args:
+        model_names: HuggingFace model ids (default: BERT_TOPIC_MODEL and
+            SENTIMENT_MODEL)
+        force_download: If True, re-download files even if they are cached
+            (default: False)
+            
+    Example:
+        >>> from src.utils.text_processing import preload_models
+        >>> preload_models()
+    """
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    
+    for name in model_names or [BERT_TOPIC_MODEL, SENTIMENT_MODEL]:
+        AutoTokenizer.from_pretrained(name, force_download=force_download)
+        AutoModelForSequenceClassification.from_pretrained(name, force_download=force_download)
+        print(f"✓ Cached {name}")
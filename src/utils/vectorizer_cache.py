@@ -0,0 +1,119 @@
+"""
+On-disk cache for fitted scikit-learn text vectorizers.
+
+Fitting a TfidfVectorizer or CountVectorizer builds the vocabulary in
+single-threaded Python and dominates the CPU time of the LDA pipeline. This
+module stores fitted vectorizers with joblib, keyed by a hash of the corpus
+and the vectorizer parameters, so reruns over the same corpus only call
+transform.
+
+Functions:
+    fit_or_load_tfidf: Fit or load a cached TfidfVectorizer
+    fit_or_load_count: Fit or load a cached CountVectorizer
+
+Example:
+    >>> from config.model_params import TFIDF_PARAMS
+    >>> from src.utils.vectorizer_cache import fit_or_load_tfidf
+    >>> vectorizer, tfidf_matrix = fit_or_load_tfidf(texts, TFIDF_PARAMS)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import xxhash
+
+from .text_processing import CACHE_DIR
+
+
+def _cache_key(vectorizer_cls, corpus: List[str], params: Dict[str, Any]) -> str:
+    """
+    Hash the vectorizer class, its parameters and the full corpus.
+
+    The scikit-learn version is included because pickled estimators are not
+    portable across versions.
+    """
+    import sklearn
+
+    hasher = xxhash.xxh3_64()
+    hasher.update(f"{vectorizer_cls.__name__}|{sklearn.__version__}|{sorted(params.items())!r}|{len(corpus)}".encode())
+    for doc in corpus:
+        hasher.update(doc.encode())
+        hasher.update(b'\x00')
+    return hasher.hexdigest()
+
+
+def _fit_or_load(
+    vectorizer_cls,
+    corpus: List[str],
+    params: Dict[str, Any],
+    cache_dir: Path
+) -> Tuple[Any, Any]:
+    """
+    Load a fitted vectorizer from cache_dir and transform, or fit and cache it.
+
+    Args:
+        vectorizer_cls: scikit-learn vectorizer class
+        corpus: List of documents
+        params: Keyword arguments for vectorizer_cls
+        cache_dir: Directory holding the joblib files
+
+    Returns:
+        Tuple of (fitted vectorizer, document-term matrix)
+    """
+    import joblib
+
+    cache_path = Path(cache_dir) / f"{_cache_key(vectorizer_cls, corpus, params)}.joblib"
+
+    if cache_path.exists():
+        print(f"✓ Loaded cached {vectorizer_cls.__name__} from {cache_path}")
+        vectorizer = joblib.load(cache_path)
+        return vectorizer, vectorizer.transform(corpus)
+
+    vectorizer = vectorizer_cls(**params)
+    matrix = vectorizer.fit_transform(corpus)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(vectorizer, cache_path)
+    print(f"✓ Cached {vectorizer_cls.__name__} to {cache_path}")
+    return vectorizer, matrix
+
+
+def fit_or_load_tfidf(
+    corpus: List[str],
+    params: Dict[str, Any],
+    cache_dir: Optional[Path] = None
+) -> Tuple[Any, Any]:
+    """
+    Fit a TfidfVectorizer on corpus, reusing a cached fit if one exists.
+
+    Args:
+        corpus: List of documents
+        params: TfidfVectorizer keyword arguments (e.g. TFIDF_PARAMS)
+        cache_dir: Cache directory (default: cache/tfidf)
+
+    Returns:
+        Tuple of (fitted TfidfVectorizer, TF-IDF matrix)
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return _fit_or_load(TfidfVectorizer, corpus, params, cache_dir or CACHE_DIR / 'tfidf')
+
+
+def fit_or_load_count(
+    corpus: List[str],
+    params: Dict[str, Any],
+    cache_dir: Optional[Path] = None
+) -> Tuple[Any, Any]:
+    """
+    Fit a CountVectorizer on corpus, reusing a cached fit if one exists.
+
+    Args:
+        corpus: List of documents
+        params: CountVectorizer keyword arguments (e.g. COUNT_VECTORIZER_PARAMS)
+        cache_dir: Cache directory (default: cache/count)
+
+    Returns:
+        Tuple of (fitted CountVectorizer, document-term matrix for LDA)
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    return _fit_or_load(CountVectorizer, corpus, params, cache_dir or CACHE_DIR / 'count')
@@ -0,0 +1,88 @@
+"""Tests for src.utils.text_processing."""
+
+import polars as pl
+
+from src.utils.text_processing import (
+    TokenizedCache,
+    tokenizer_fingerprint,
+    trim_to_max_chars,
+    trim_to_max_words_native,
+)
+
+
+class FakeTokenizer:
+    """Minimal whitespace tokenizer exposing the HuggingFace attributes used."""
+
+    def __init__(self, words, name_or_path=''):
+        specials = ['[PAD]', '[UNK]', '[CLS]', '[SEP]']
+        self.vocab = {w: i for i, w in enumerate(specials + list(words))}
+        self.name_or_path = name_or_path
+        self.model_max_length = 512
+        self.calls = 0
+
+    def get_vocab(self):
+        return dict(self.vocab)
+
+    def __call__(self, texts):
+        self.calls += 1
+        input_ids = [
+            [self.vocab['[CLS]']]
+            + [self.vocab.get(w, self.vocab['[UNK]']) for w in t.split()]
+            + [self.vocab['[SEP]']]
+            for t in texts
+        ]
+        return {
+            'input_ids': input_ids,
+            'attention_mask': [[1] * len(ids) for ids in input_ids],
+        }
+
+
+def test_tokenized_cache_hits_for_same_tokenizer(tmp_path):
+    cache = TokenizedCache(tmp_path / 'tokens.parquet')
+    tokenizer = FakeTokenizer(['a', 'b', 'c'])
+
+    first = cache.encode(['a b c'], tokenizer)
+    second = cache.encode(['a b c'], tokenizer)
+
+    assert tokenizer.calls == 1
+    assert second['input_ids'].to_list() == first['input_ids'].to_list()
+
+
+def test_tokenized_cache_misses_for_different_tokenizer(tmp_path):
+    cache = TokenizedCache(tmp_path / 'tokens.parquet')
+    tokenizer_a = FakeTokenizer(['a', 'b', 'c'])
+    tokenizer_b = FakeTokenizer(['c', 'b', 'a'])  # Same words, different ids
+
+    cache.encode(['a b c'], tokenizer_a)
+    encoded_b = cache.encode(['a b c'], tokenizer_b)
+
+    assert tokenizer_fingerprint(tokenizer_a) != tokenizer_fingerprint(tokenizer_b)
+    assert tokenizer_b.calls == 1
+    assert encoded_b['input_ids'].to_list() == tokenizer_b(['a b c'])['input_ids']
+
+
+def test_trim_to_max_chars_cuts_at_word_boundary():
+    df = pl.DataFrame({'text': ['abc def ghi', 'short', ' ' + 'a' * 20]})
+
+    trimmed = trim_to_max_chars(df, 'text', max_chars=8)
+
+    # The long word after leading whitespace falls back to a hard slice
+    assert trimmed['text'].to_list() == ['abc def', 'short', ' aaaaaaa']
+
+
+def test_trim_to_max_words_native_accepts_lazyframe():
+    df = pl.DataFrame({'text': ['a b c d', 'a b', None]})
+
+    trimmed = trim_to_max_words_native(df.lazy(), 'text', max_words=3)
+
+    assert isinstance(trimmed, pl.LazyFrame)
+    assert trimmed.collect().equals(trim_to_max_words_native(df, 'text', max_words=3))
+    assert trimmed.collect()['text'].to_list() == ['a b c', 'a b', None]
+
+
+def test_trim_to_max_words_native_large_max_words():
+    df = pl.DataFrame({'text': ['w ' * 20_000]})
+
+    trimmed = trim_to_max_words_native(df, 'text', max_words=10_000)
+
+    assert trimmed['text'][0] == ' '.join(['w'] * 10_000)